@@ -3,6 +3,7 @@
 ###############################################################################
 # MCP Automation Script for Travel Wizards
 # This script orchestrates automated interactive testing across all platforms
+# Stages run serially here; scripts/mcp_orchestrator.py runs them concurrently
 ###############################################################################
 
 set -e
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Asyncio test orchestrator for Travel Wizards (concurrent replacement for mcp_automation.sh).
+Stages form a dependency graph; independent stages run concurrently, limited per resource pool,
+each with its own timeout and a streamed, stage-prefixed log. The report stage runs once all
+test stages have finished and reads their artifacts through scripts/reporting/generate_report.py.
+Each run writes its artifacts to a new build/reports/artifacts/<timestamp>/ directory.
+Usage:
+  python3 scripts/mcp_orchestrator.py
+  python3 scripts/mcp_orchestrator.py --only unit_tests,selenium --limit flutter=1 --limit browser=2
+"""
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import signal
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+
+WORKSPACE_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+TIMESTAMP = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+# Default concurrency per resource pool. Concurrent `flutter test` runs contend on the
+# project build lock, so the flutter pool is serial; headless browsers can share the host.
+DEFAULT_LIMITS = {'flutter': 1, 'browser': 2, 'local': 4}
+
+STREAM_CHUNK = 64 * 1024
+CONSOLE_LINE_LIMIT = 2000
+
+PASSED, FAILED, SKIPPED, TIMEOUT = 'PASS', 'FAIL', 'SKIPPED', 'TIMEOUT'
+
+
+@dataclass
+class Stage:
+    name: str
+    cmd: list
+    cwd: str = WORKSPACE_ROOT
+    deps: tuple = ()
+    pool: str = 'local'
+    timeout: float = 900
+    requires: tuple = ()
+    status: str = SKIPPED
+    output: str = ''
+    duration: float = 0.0
+    log_path: str = ''
+    started: float = 0.0
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+def build_stages(artifacts, report_out):
+    """The mcp_automation.sh pipeline as a graph; `deps` only orders stages, failures do not cascade."""
+    web_dir = os.path.join(WORKSPACE_ROOT, 'scripts', 'web')
+    return [
+        Stage('unit_tests',
+              ['flutter', 'test', '--coverage', '--reporter=expanded',
+               f'--file-reporter=json:{os.path.join(artifacts, "flutter_unit.ndjson")}'],
+              pool='flutter', timeout=1200, requires=('flutter',)),
+        Stage('integration_tests',
+              ['flutter', 'test', 'integration_test/', '--device-id=chrome', '--reporter=expanded'],
+              pool='flutter', timeout=1800, requires=('flutter', 'google-chrome|chromium-browser|chromium')),
+        Stage('web_puppeteer',
+              ['node', 'test_chrome_puppeteer.js', f'--out={os.path.join(artifacts, "web_results.json")}'],
+              cwd=web_dir, pool='browser', timeout=600, requires=('node',)),
+        Stage('selenium',
+              [sys.executable, '-m', 'pytest', 'tests/', '-q', f'--phase-profile={artifacts}'],
+              pool='browser', timeout=1800),
+        Stage('report',
+              [sys.executable, os.path.join('scripts', 'reporting', 'generate_report.py'),
+               '--dir', artifacts, '--out', report_out],
+              deps=('unit_tests', 'integration_tests', 'web_puppeteer', 'selenium'), timeout=120),
+    ]
+
+
+def missing_tool(stage):
+    for req in stage.requires:
+        if not any(shutil.which(alt) for alt in req.split('|')):
+            return req
+    return None
+
+
+async def stream(stage, proc, log):
+    """Copy output to the log and the console line by line; reads in chunks so long lines cannot overflow."""
+    pending = b''
+    while True:
+        chunk = await proc.stdout.read(STREAM_CHUNK)
+        if not chunk:
+            break
+        *lines, pending = (pending + chunk).split(b'\n')
+        for raw in lines:
+            emit(stage, log, raw)
+    if pending:
+        emit(stage, log, pending)
+
+
+def emit(stage, log, raw):
+    line = raw.decode(errors='replace').rstrip()
+    log.write(line + '\n')
+    if len(line) > CONSOLE_LINE_LIMIT:
+        line = line[:CONSOLE_LINE_LIMIT] + f"... [{len(line) - CONSOLE_LINE_LIMIT} more chars in log]"
+    print(f"[{stage.name}] {line}", flush=True)
+
+
+def kill_group(proc):
+    if proc is not None and proc.returncode is None:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+
+async def run_stage(stage, stages, pools, log_dir):
+    for dep in stage.deps:
+        await stages[dep].done.wait()
+
+    try:
+        tool = missing_tool(stage)
+        if tool:
+            stage.status, stage.output = SKIPPED, f"{tool} not found"
+            print(f"[{stage.name}] skipped: {stage.output}", flush=True)
+            return
+
+        async with pools[stage.pool]:
+            stage.log_path = os.path.join(log_dir, f"{stage.name}_{TIMESTAMP}.log")
+            print(f"[{stage.name}] started: {' '.join(stage.cmd)}", flush=True)
+            start = time.monotonic()
+            stage.started = time.time()
+            proc = None
+            with open(stage.log_path, 'w') as log:
+                try:
+                    proc = await asyncio.create_subprocess_exec(
+                        *stage.cmd, cwd=stage.cwd,
+                        stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT,
+                        start_new_session=True)
+                    await asyncio.wait_for(asyncio.gather(stream(stage, proc, log), proc.wait()), stage.timeout)
+                    stage.status = PASSED if proc.returncode == 0 else FAILED
+                    stage.output = f"exit {proc.returncode}"
+                except asyncio.TimeoutError:
+                    kill_group(proc)
+                    await proc.wait()
+                    stage.status, stage.output = TIMEOUT, f"timed out after {stage.timeout:.0f}s"
+                except Exception as e:
+                    # One stage crashing must not cancel the others or the report
+                    kill_group(proc)
+                    if proc is not None:
+                        await proc.wait()
+                    stage.status, stage.output = FAILED, f"orchestrator error: {type(e).__name__}: {e}"
+            stage.duration = time.monotonic() - start
+            print(f"[{stage.name}] {stage.status} in {stage.duration:.1f}s ({stage.output})", flush=True)
+    finally:
+        stage.done.set()
+
+
+def write_stage_results(stages, artifacts):
+    """Stage outcomes as a report-generator artifact; flutter_unit.ndjson is read by the report itself."""
+    results = [{
+        'test': f"Orchestrator_{s.name}",
+        'status': s.status,
+        'output': f"{s.output}; {s.duration:.1f}s; log: {os.path.relpath(s.log_path, WORKSPACE_ROOT) if s.log_path else '-'}",
+    } for s in stages if s.name != 'report']
+    with open(os.path.join(artifacts, 'orchestrator_results.json'), 'w') as f:
+        json.dump({'timestamp': TIMESTAMP, 'results': results}, f, indent=2)
+
+
+def fresh_coverage(unit_tests):
+    """coverage/lcov.info, but only if this run's unit_tests stage ran and wrote it."""
+    lcov = os.path.join(WORKSPACE_ROOT, 'coverage', 'lcov.info')
+    if unit_tests is None or unit_tests.status not in (PASSED, FAILED) or not os.path.isfile(lcov):
+        return None
+    return lcov if os.path.getmtime(lcov) >= unit_tests.started else None
+
+
+async def start_emulators(log_dir):
+    """Firebase emulators for the duration of the run, as mcp_automation.sh does."""
+    if not shutil.which('firebase'):
+        print('[emulators] skipped: firebase not found', flush=True)
+        return None
+    with open(os.path.join(log_dir, f"emulators_{TIMESTAMP}.log"), 'w') as log:
+        proc = await asyncio.create_subprocess_exec(
+            'firebase', 'emulators:start', '--only', 'firestore,auth,storage', '--project', 'demo-test',
+            cwd=WORKSPACE_ROOT, stdout=log, stderr=asyncio.subprocess.STDOUT, start_new_session=True)
+    await asyncio.sleep(5)
+    print(f"[emulators] started (PID: {proc.pid})", flush=True)
+    return proc
+
+
+async def stop_emulators(proc):
+    if proc and proc.returncode is None:
+        os.killpg(proc.pid, signal.SIGTERM)
+        await proc.wait()
+        print('[emulators] stopped', flush=True)
+
+
+async def orchestrate(stages, limits, artifacts, log_dir, emulators=True):
+    pools = {name: asyncio.Semaphore(n) for name, n in limits.items()}
+    by_name = {s.name: s for s in stages}
+    report = by_name.get('report')
+    tests = [s for s in stages if s is not report]
+
+    firebase = await start_emulators(log_dir) if emulators else None
+    try:
+        outcomes = await asyncio.gather(*(run_stage(s, by_name, pools, log_dir) for s in tests),
+                                        return_exceptions=True)
+        for stage, outcome in zip(tests, outcomes):
+            if isinstance(outcome, Exception):
+                stage.status, stage.output = FAILED, f"orchestrator error: {type(outcome).__name__}: {outcome}"
+    finally:
+        await stop_emulators(firebase)
+    write_stage_results(tests, artifacts)
+    lcov = fresh_coverage(by_name.get('unit_tests'))
+    if report and lcov:
+        report.cmd += ['--lcov', lcov]
+    if report:
+        await run_stage(report, by_name, pools, log_dir)
+
+
+def parse_limits(values):
+    limits = dict(DEFAULT_LIMITS)
+    for value in values or []:
+        name, _, n = value.partition('=')
+        limits[name] = int(n)
+    return limits
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument('--artifacts', '-a', default=os.path.join(WORKSPACE_ROOT, 'build', 'reports', 'artifacts'),
+                   help='Parent directory; each run writes to its own <artifacts>/<timestamp>/')
+    p.add_argument('--out', '-o', default=os.path.join(WORKSPACE_ROOT, 'build', 'reports', f'MCP_TEST_REPORT_{TIMESTAMP}.md'))
+    p.add_argument('--only', help='Comma-separated stage names to run (report always runs)')
+    p.add_argument('--limit', action='append', metavar='POOL=N', help='Concurrency limit per pool')
+    p.add_argument('--timeout', action='append', metavar='STAGE=SECONDS', help='Per-stage timeout override')
+    p.add_argument('--no-emulators', action='store_true', help='Do not start the Firebase emulators')
+    args = p.parse_args()
+
+    # A fresh directory per run, so skipped or failed stages cannot leave an older run's output in the report
+    artifacts = os.path.join(os.path.abspath(args.artifacts), TIMESTAMP)
+    log_dir = os.path.join(WORKSPACE_ROOT, 'build', 'logs')
+    os.makedirs(artifacts, exist_ok=True)
+    os.makedirs(log_dir, exist_ok=True)
+
+    stages = build_stages(artifacts, os.path.abspath(args.out))
+    if args.only:
+        keep = set(args.only.split(',')) | {'report'}
+        stages = [s for s in stages if s.name in keep]
+        for s in stages:
+            s.deps = tuple(d for d in s.deps if d in keep)
+    for value in args.timeout or []:
+        name, _, seconds = value.partition('=')
+        for s in stages:
+            if s.name == name:
+                s.timeout = float(seconds)
+
+    start = time.monotonic()
+    asyncio.run(orchestrate(stages, parse_limits(args.limit), artifacts, log_dir, not args.no_emulators))
+    elapsed = time.monotonic() - start
+
+    print('\nStage summary:')
+    for s in stages:
+        print(f"  {s.name:<18} {s.status:<8} {s.duration:7.1f}s  {s.output}")
+    longest = max((s.duration for s in stages), default=0.0)
+    print(f"Artifacts: {artifacts}")
+    print(f"Wall clock {elapsed:.1f}s (longest stage {longest:.1f}s, serial sum {sum(s.duration for s in stages):.1f}s)")
+
+    sys.exit(1 if any(s.status in (FAILED, TIMEOUT) for s in stages) else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Android frame-timing analysis from recorded `dumpsys gfxinfo <pkg> framestats` and `adb logcat` dumps.
+Frame durations (FrameCompleted - IntendedVsync) become NumPy arrays per screen, summarised as jank %,
+p90/p95/p99 frame time and slow/frozen frame counts. Works offline on files captured with e.g.:
+  adb shell dumpsys gfxinfo com.example.trip_wizards reset
+  # ... exercise one screen ...
+  adb shell dumpsys gfxinfo com.example.trip_wizards framestats > artifacts/framestats_explore.txt
+  adb logcat -d -v threadtime > artifacts/logcat.txt
+A dump is attributed to the screen in its file name (framestats_<screen>[_<timestamp>].txt), to
+"# screen: <name>" marker lines inside it, or else to its window. Logcat lines are attributed to the last
+screen marker seen (ActivityTaskManager "Displayed" lines or "flutter: screen=<name>" debug prints).
+Davey/Choreographer lines only count when they come from the app's process: its pid is taken from
+--pid, "Start proc <pid>:<package>/" lines and the app's own flutter log lines. When none of these
+names a pid (e.g. a capture already filtered with `adb logcat -d --pid=$(adb shell pidof <package>)`),
+every line is counted.
+Usage:
+  python3 scripts/reporting/android_frame_stats.py --framestats artifacts/framestats_*.txt --logcat artifacts/logcat.txt --out artifacts/frame_stats.json
+"""
+import argparse
+import io
+import json
+import os
+import re
+
+import numpy as np
+
+REFRESH_RATE_HZ = 60.0
+SLOW_FRAME_MS = 16.0
+FROZEN_FRAME_MS = 700.0
+DEFAULT_SCREEN = 'app'
+APP_PACKAGE = 'com.example.trip_wizards'
+
+PROFILE_MARKER = '---PROFILEDATA---'
+SCREEN_MARKER = re.compile(r'^\s*#\s*screen:\s*(.+?)\s*$', re.IGNORECASE)
+WINDOW_LINE = re.compile(r'^\s*Window:\s*(\S+)')
+DUMP_NAME = re.compile(r'framestats_(.+?)(?:_\d{8}_\d{6})?\.txt$')
+
+LOGCAT_DISPLAYED = re.compile(r'ActivityTaskManager: Displayed (\S+?):? \+')
+LOGCAT_SCREEN = re.compile(r'flutter\s*:\s*(?:screen|route)[:=]\s*(\S+)', re.IGNORECASE)
+LOGCAT_PID = [
+    re.compile(r'^\d\d-\d\d \S+\s+(\d+)\s+\d+\s+[VDIWEFA] '),  # threadtime
+    re.compile(r'^[VDIWEFA]/[^(]*\(\s*(\d+)\)'),                # brief
+]
+LOGCAT_START_PROC = re.compile(r'Start proc (\d+):([\w.]+)/')
+LOGCAT_FLUTTER = re.compile(r'\bflutter\s*:')
+LOGCAT_DAVEY = re.compile(r'Davey! duration=(\d+)ms')
+LOGCAT_SKIPPED = re.compile(r'Choreographer.*Skipped (\d+) frames')
+
+
+def short_window(name):
+    """com.example.trip_wizards/com.example.trip_wizards.MainActivity -> MainActivity"""
+    return name.rsplit('/', 1)[-1].rsplit('.', 1)[-1]
+
+
+def _profile_frames(header, rows):
+    """Durations in ms of the valid frames (Flags == 0) of one PROFILEDATA block."""
+    cols = header.rstrip(',').split(',')
+    try:
+        usecols = (cols.index('Flags'), cols.index('IntendedVsync'), cols.index('FrameCompleted'))
+    except ValueError:
+        return np.empty(0)
+    if not rows:
+        return np.empty(0)
+    data = np.loadtxt(io.StringIO('\n'.join(rows)), delimiter=',', usecols=usecols, dtype=np.int64, ndmin=2)
+    valid = (data[:, 0] == 0) & (data[:, 2] > data[:, 1])
+    return (data[valid, 2] - data[valid, 1]) / 1e6
+
+
+def parse_framestats(text, screen=None):
+    """{screen: frame durations (ms)} from one dumpsys gfxinfo framestats dump."""
+    frames = {}
+    marker = window = None
+    in_profile, header, rows = False, None, []
+    for line in text.splitlines():
+        if line.strip() == PROFILE_MARKER:
+            if in_profile and header:
+                name = marker or screen or window or DEFAULT_SCREEN
+                frames[name] = np.concatenate([frames.get(name, np.empty(0)), _profile_frames(header, rows)])
+            in_profile, header, rows = not in_profile, None, []
+        elif in_profile:
+            if header is None:
+                header = line.strip()
+            elif line.strip():
+                rows.append(line.strip())
+        elif SCREEN_MARKER.match(line):
+            marker = SCREEN_MARKER.match(line).group(1)
+        elif WINDOW_LINE.match(line):
+            window = short_window(WINDOW_LINE.match(line).group(1))
+    return frames
+
+
+def line_pid(line):
+    for pattern in LOGCAT_PID:
+        m = pattern.match(line)
+        if m:
+            return int(m.group(1))
+    return None
+
+
+def app_pids(lines, package=APP_PACKAGE, pids=()):
+    """Pids of the app process: given ones, "Start proc" lines for `package` and flutter log lines."""
+    found = set(pids)
+    for line in lines:
+        m = LOGCAT_START_PROC.search(line)
+        if m and m.group(2) == package:
+            found.add(int(m.group(1)))
+        elif LOGCAT_FLUTTER.search(line):
+            pid = line_pid(line)
+            if pid is not None:
+                found.add(pid)
+    return found
+
+
+def parse_logcat(lines, package=APP_PACKAGE, pids=()):
+    """{screen: {'davey_ms': np.ndarray, 'skipped': int}} from the app's logcat lines, in log order.
+
+    Lines are filtered by pid only when the app's pid is known; otherwise the dump is taken as the app's own.
+    """
+    lines = list(lines)
+    own = app_pids(lines, package, pids)
+    davey, skipped = {}, {}
+    screen = DEFAULT_SCREEN
+    for line in lines:
+        m = LOGCAT_DISPLAYED.search(line)
+        if m:
+            if not package or m.group(1).startswith(package + '/'):
+                screen = short_window(m.group(1))
+            continue
+        pid = line_pid(line)
+        if own and pid is not None and pid not in own:
+            continue
+        m = LOGCAT_SCREEN.search(line)
+        if m:
+            screen = m.group(1)
+            continue
+        m = LOGCAT_DAVEY.search(line)
+        if m:
+            davey.setdefault(screen, []).append(float(m.group(1)))
+            continue
+        m = LOGCAT_SKIPPED.search(line)
+        if m:
+            skipped[screen] = skipped.get(screen, 0) + int(m.group(1))
+    return {
+        s: {'davey_ms': np.asarray(davey.get(s, []), dtype=float), 'skipped': skipped.get(s, 0)}
+        for s in set(davey) | set(skipped)
+    }
+
+
+def screen_stats(frames, logcat=None, refresh_rate=REFRESH_RATE_HZ):
+    """Jank %, percentile frame times and slow/frozen counts for one screen."""
+    budget = 1000.0 / refresh_rate
+    davey = logcat['davey_ms'] if logcat else np.empty(0)
+    n = frames.size
+    if n:
+        p90, p95, p99 = np.percentile(frames, [90, 95, 99])
+    else:
+        p90 = p95 = p99 = 0.0
+    return {
+        'frames': int(n),
+        'jank_pct': round(100.0 * np.count_nonzero(frames > budget) / n, 2) if n else 0.0,
+        'p90_ms': round(float(p90), 2),
+        'p95_ms': round(float(p95), 2),
+        'p99_ms': round(float(p99), 2),
+        'slow_frames': int(np.count_nonzero(frames > SLOW_FRAME_MS)),
+        # framestats only keeps the last 120 frames; Davey lines cover the whole session
+        'frozen_frames': int(max(np.count_nonzero(frames > FROZEN_FRAME_MS), np.count_nonzero(davey >= FROZEN_FRAME_MS))),
+        'skipped_frames': int(logcat['skipped']) if logcat else 0,
+    }
+
+
+def screen_from_filename(path):
+    m = DUMP_NAME.search(os.path.basename(path))
+    return m.group(1) if m else None
+
+
+def analyze(framestats_paths=(), logcat_paths=(), refresh_rate=REFRESH_RATE_HZ, package=APP_PACKAGE, pids=()):
+    """Per-screen stats; dumps that cannot be read or parsed are skipped and listed under 'errors'."""
+    frames, errors = {}, []
+    for path in framestats_paths:
+        try:
+            with open(path, errors='replace') as f:
+                parsed = parse_framestats(f.read(), screen_from_filename(path))
+        except Exception as e:
+            errors.append({'file': os.path.basename(path), 'error': str(e)})
+            continue
+        for screen, durations in parsed.items():
+            frames[screen] = np.concatenate([frames.get(screen, np.empty(0)), durations])
+
+    logcat = {}
+    for path in logcat_paths:
+        try:
+            with open(path, errors='replace') as f:
+                parsed = parse_logcat(f, package, pids)
+        except Exception as e:
+            errors.append({'file': os.path.basename(path), 'error': str(e)})
+            continue
+        for screen, entry in parsed.items():
+            prev = logcat.get(screen)
+            logcat[screen] = entry if prev is None else {
+                'davey_ms': np.concatenate([prev['davey_ms'], entry['davey_ms']]),
+                'skipped': prev['skipped'] + entry['skipped'],
+            }
+
+    screens = sorted(set(frames) | set(logcat))
+    return {
+        'frame_stats': {
+            'refresh_rate_hz': refresh_rate,
+            'screens': {s: screen_stats(frames.get(s, np.empty(0)), logcat.get(s), refresh_rate) for s in screens},
+            'errors': errors,
+        }
+    }
+
+
+def frame_stats_section(stats_list):
+    """Markdown "Android Frame Timing" table for one or more frame_stats results."""
+    md = "\n### 📱 Android Frame Timing\n\n"
+    md += "| Screen | Frames | Jank % | P90 (ms) | P95 (ms) | P99 (ms) | Slow (>16ms) | Frozen (>700ms) | Skipped |\n"
+    md += "| :--- | ---: | ---: | ---: | ---: | ---: | ---: | ---: | ---: |\n"
+    for stats in stats_list:
+        for screen, s in stats.get('screens', {}).items():
+            md += (f"| {screen} | {s['frames']} | {s['jank_pct']:.1f}% | {s['p90_ms']:.1f} | {s['p95_ms']:.1f} | "
+                   f"{s['p99_ms']:.1f} | {s['slow_frames']} | {s['frozen_frames']} | {s['skipped_frames']} |\n")
+    return md
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument('--framestats', nargs='*', default=[], help='dumpsys gfxinfo framestats dumps')
+    p.add_argument('--logcat', nargs='*', default=[], help='adb logcat dumps')
+    p.add_argument('--refresh-rate', type=float, default=REFRESH_RATE_HZ)
+    p.add_argument('--package', default=APP_PACKAGE, help='App package whose logcat lines are counted')
+    p.add_argument('--pid', type=int, action='append', default=[], help='App pid(s), if not in the logcat dump')
+    p.add_argument('--out', '-o', default='artifacts/frame_stats.json')
+    args = p.parse_args()
+
+    result = analyze(args.framestats, args.logcat, args.refresh_rate, args.package, args.pid)
+    outdir = os.path.dirname(args.out)
+    if outdir:
+        os.makedirs(outdir, exist_ok=True)
+    with open(args.out, 'w') as f:
+        json.dump(result, f, indent=2)
+    print(frame_stats_section([result['frame_stats']]))
+    print('Wrote frame stats to', args.out)
+
+
+if __name__ == '__main__':
+    main()
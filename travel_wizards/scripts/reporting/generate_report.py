@@ -1,12 +1,26 @@
 #!/usr/bin/env python3
 """
 Aggregate test outputs (Puppeteer JSON + Flutter JSON) into the required Markdown report template.
+Selenium phase profiles (tests/phase_profiler.py) are summarised in a "Time by Phase" table.
+Android frame timing (framestats*.txt / logcat*.txt in --dir, or frame_stats JSON) comes from
+scripts/reporting/android_frame_stats.py.
+Coverage from lcov files (--lcov, or *.info in --dir) is merged by scripts/reporting/lcov_coverage.py.
+Artifacts may be .json, .json.gz, .json.zst, .ndjson or .ndjson.gz (e.g. the `flutter test` JSON reporter
+stream); compressed files are decompressed as a stream, and payloads without a report key are
+byte-scanned and previewed instead of parsed.
 Usage:
   python3 scripts/reporting/generate_report.py --dir artifacts/ --out report.md
 """
 import argparse
+import glob
+import gzip
+import io
 import json
+import mmap
 import os
+import re
+
+from lcov_coverage import coverage_section, load_summary, summarize
 
 TEMPLATE_HEADER = '''# Application Interactive Feature Test Report
 
@@ -17,41 +31,258 @@ TEMPLATE_HEADER = '''# Application Interactive Feature Test Report
 '''
 
 
+ARTIFACT_SUFFIXES = ('.json', '.json.gz', '.json.zst', '.ndjson', '.ndjson.gz')
+
+# Top-level keys the report understands; artifacts without any of them are only previewed
+REPORT_KEYS = ('results', 'phase_profile', 'coverage', 'frame_stats')
+
+DETAILS_LIMIT = 200
+MMAP_THRESHOLD = 8 * 1024 * 1024
+CHUNK_SIZE = 1024 * 1024
+KEY_SCAN_OVERLAP = 256
+
+
+class ArtifactPreview(str):
+    """Truncated text of an artifact that was not parsed."""
+
+
+def bounded_dumps(obj, limit=DETAILS_LIMIT):
+    """json.dumps(obj)[:limit], but stops encoding once `limit` characters have been produced."""
+    out, size = [], 0
+    # _one_shot=False selects the lazy pure-Python encoder instead of the C one that builds everything
+    for chunk in json.JSONEncoder(default=str).iterencode(obj, _one_shot=False):
+        out.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return ''.join(out)[:limit]
+
+
+def preview_bytes(raw, limit=DETAILS_LIMIT):
+    text = raw.decode('utf-8', errors='replace')
+    return ArtifactPreview(re.sub(r'\s+', ' ', text).strip()[:limit])
+
+
+def open_zstd(path):
+    try:
+        from compression import zstd  # Python 3.14+
+        return zstd.open(path, 'rb')
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError('reading .zst artifacts needs Python 3.14+ or the zstandard package')
+    return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True))
+
+
+def open_artifact(path):
+    """Binary file object for an artifact, decompressing on the fly."""
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rb')
+    if path.endswith('.zst'):
+        return open_zstd(path)
+    return open(path, 'rb')
+
+
+def key_pattern():
+    """Matches a report key used as an object key ("results":), not as a string value elsewhere."""
+    return re.compile(rb'"(?:' + b'|'.join(re.escape(k.encode()) for k in REPORT_KEYS) + rb')"\s*:')
+
+
+def stream_contains(f, pattern, tail=b''):
+    """Scan a binary stream chunk by chunk for `pattern`, keeping only a small overlap in memory."""
+    window = tail
+    while True:
+        if pattern.search(window):
+            return True
+        chunk = f.read(CHUNK_SIZE)
+        if not chunk:
+            return False
+        window = window[-KEY_SCAN_OVERLAP:] + chunk
+
+
+def is_result_row(record):
+    return isinstance(record, dict) and isinstance(record.get('test'), str) and 'status' in record
+
+
+def flutter_event_rows(events, names):
+    """Result rows from `flutter test --reporter=json` events, pairing testStart names with testDone results."""
+    rows = []
+    for event in events:
+        kind = event.get('type')
+        if kind == 'testStart':
+            names[event['test']['id']] = event['test']['name']
+        elif kind == 'testDone' and not event.get('hidden'):
+            result = event.get('result')
+            rows.append({
+                'test': names.get(event['testID'], 'unknown'),
+                'status': 'PASS' if result == 'success' else 'FAIL',
+                'output': f"Flutter unit test ({result})",
+            })
+    return rows
+
+
+def load_ndjson(path):
+    """Result rows from an NDJSON artifact (result rows or flutter reporter events); other streams are previewed."""
+    rows, names, count, preview = [], {}, 0, None
+    with open_artifact(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # e.g. the last line of a reporter stream cut off by a killed test run
+                continue
+            count += 1
+            if is_result_row(record):
+                rows.append(record)
+            elif isinstance(record, dict) and record.get('type') in ('testStart', 'testDone'):
+                rows.extend(flutter_event_rows([record], names))
+            elif preview is None:
+                preview = bounded_dumps(record)
+    if rows:
+        return {'results': rows}
+    return ArtifactPreview(f"{count} records: {preview or ''}"[:DETAILS_LIMIT])
+
+
+def load_json_artifact(path):
+    """Parse an artifact, or return a preview when it has none of REPORT_KEYS as an object key.
+
+    The key check is a byte scan, not a parse: it avoids building objects for payloads the report
+    cannot use, but still reads the whole file (mmap for large .json, streaming decompression for
+    .gz/.zst) when no key is present. A key nested below the top level also counts as a match, in
+    which case the artifact is parsed in full.
+    """
+    if path.endswith(('.ndjson', '.ndjson.gz')):
+        return load_ndjson(path)
+
+    if path.endswith('.json') and os.path.getsize(path) >= MMAP_THRESHOLD:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if not key_pattern().search(mm):
+                return preview_bytes(mm[:DETAILS_LIMIT * 4])
+            return json.loads(mm[:])
+
+    if path.endswith(('.gz', '.zst')):
+        # Decompress once to look for a report key; only artifacts that have one are parsed
+        with open_artifact(path) as f:
+            head = f.read(DETAILS_LIMIT * 4)
+            if not stream_contains(f, key_pattern(), tail=head):
+                return preview_bytes(head)
+
+    with open_artifact(path) as f:
+        return json.load(f)
+
+
 def load_json_files(dirpath):
     results = []
     if not os.path.isdir(dirpath):
         return results
-    for fn in os.listdir(dirpath):
-        if fn.endswith('.json'):
+    for fn in sorted(os.listdir(dirpath)):
+        if fn.endswith(ARTIFACT_SUFFIXES):
             try:
-                data = json.load(open(os.path.join(dirpath, fn)))
+                data = load_json_artifact(os.path.join(dirpath, fn))
                 results.append((fn, data))
             except Exception as e:
                 results.append((fn, {'error': str(e)}))
     return results
 
 
+def phase_table(profiles):
+    """Aggregate phase_profile artifacts into a Markdown "time by phase" table."""
+    totals = {}
+    tests = 0
+    for profile in profiles:
+        tests += len(profile.get('tests', []))
+        for name, phase in profile.get('totals', {}).items():
+            t = totals.setdefault(name, {'ms': 0.0, 'calls': 0})
+            t['ms'] += phase.get('ms', 0.0)
+            t['calls'] += phase.get('calls', 0)
+    grand = sum(t['ms'] for t in totals.values()) or 1.0
+
+    md = "\n### ⏱️ Selenium Time by Phase\n\n"
+    md += f"Aggregated over {tests} test(s).\n\n"
+    md += "| Phase | Calls | Total (s) | Mean per Test (ms) | Share |\n"
+    md += "| :--- | ---: | ---: | ---: | ---: |\n"
+    for name, t in sorted(totals.items(), key=lambda kv: -kv[1]['ms']):
+        mean = t['ms'] / tests if tests else 0.0
+        md += f"| {name} | {t['calls']} | {t['ms'] / 1000:.2f} | {mean:.1f} | {100 * t['ms'] / grand:.1f}% |\n"
+    return md
+
+
 def main():
     p = argparse.ArgumentParser()
     p.add_argument('--dir', '-d', default='artifacts')
     p.add_argument('--out', '-o', default='artifacts/report.md')
+    p.add_argument('--lcov', action='append', default=[], help='lcov file(s) to merge; *.info in --dir are added')
+    p.add_argument('--coverage-baseline', help='Previous coverage summary JSON or lcov file to diff against')
+    p.add_argument('--coverage-summary-out', help='Write the merged coverage summary JSON here')
+    p.add_argument('--framestats', action='append', default=[], help='dumpsys gfxinfo framestats dump(s)')
+    p.add_argument('--logcat', action='append', default=[], help='adb logcat dump(s) for frame timing')
+    p.add_argument('--package', help='App package whose logcat lines are counted (default: the Travel Wizards app)')
+    p.add_argument('--pid', type=int, action='append', default=[], help='App pid(s), if not in the logcat dump')
     args = p.parse_args()
 
     rows = []
+    profiles = []
+    frame_stats = []
     files = load_json_files(args.dir)
     for fn, data in files:
         # probe shape
         if isinstance(data, dict) and 'results' in data:
             for r in data['results']:
                 rows.append((r.get('test','unknown'), r.get('status','ERROR'), r.get('output','')))
+        elif isinstance(data, dict) and 'phase_profile' in data:
+            profiles.append(data['phase_profile'])
+        elif isinstance(data, dict) and 'frame_stats' in data:
+            frame_stats.append(data['frame_stats'])
+        elif isinstance(data, dict) and 'coverage' in data:
+            # Coverage summaries are --coverage-baseline inputs, not results
+            continue
+        elif isinstance(data, ArtifactPreview):
+            rows.append((fn, 'UNKNOWN', data))
         else:
-            rows.append((fn, 'UNKNOWN', json.dumps(data)[:200]))
+            rows.append((fn, 'UNKNOWN', bounded_dumps(data)))
+
+    framestats = args.framestats + sorted(glob.glob(os.path.join(args.dir, 'framestats*.txt')))
+    logcat = args.logcat + sorted(glob.glob(os.path.join(args.dir, 'logcat*.txt')))
+    frame_stats_md = ''
+    if framestats or logcat or frame_stats:
+        try:
+            # NumPy is only needed when there is Android frame data to report
+            from android_frame_stats import APP_PACKAGE, analyze, frame_stats_section
+        except ImportError as e:
+            rows.append(('Android frame timing', 'UNKNOWN', f"not analysed: {e}"))
+        else:
+            if framestats or logcat:
+                # Raw dumps supersede frame_stats JSON, which is usually a summary of the same dumps
+                package = args.package or APP_PACKAGE
+                frame_stats = [analyze(framestats, logcat, package=package, pids=args.pid)['frame_stats']]
+            for stats in frame_stats:
+                for err in stats.get('errors', []):
+                    rows.append((err['file'], 'UNKNOWN', bounded_dumps({'error': err['error']})))
+            frame_stats_md = frame_stats_section(frame_stats)
 
     # Build a simple report mapping
     md = TEMPLATE_HEADER
     for test, status, details in rows:
         md += f"| {test} | {test} | Mixed | {status} | {details} |\n"
 
+    if profiles:
+        md += phase_table(profiles)
+
+    md += frame_stats_md
+
+    lcov_files = args.lcov + sorted(glob.glob(os.path.join(args.dir, '*.info')))
+    if lcov_files:
+        coverage = summarize(lcov_files)
+        baseline = load_summary(args.coverage_baseline) if args.coverage_baseline else None
+        md += coverage_section(coverage, baseline)
+        if args.coverage_summary_out:
+            with open(args.coverage_summary_out, 'w') as f:
+                json.dump(coverage, f, indent=2)
+
     # Append TODO section
     md += "\n### ❌ List of Incomplete/Not Working Features (Summary)\n\n"
     md += "TODO Tasks\n----------\n\n- [ ] Add all the tasks that need to be fixed/updated based on the test results as TODO lists.\n"
@@ -61,7 +292,7 @@ def main():
         os.makedirs(outdir)
     with open(args.out, 'w') as f:
         f.write(md)
-    debugPrint('Wrote report to', args.out)
+    print('Wrote report to', args.out)
 
 if __name__ == '__main__':
     main()
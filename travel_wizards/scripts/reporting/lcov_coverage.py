@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Streaming lcov aggregation for the Travel Wizards report.
+Merges lcov.info files from sharded `flutter test --coverage` runs into one compact hit array per source
+file (array('q') indexed by line number, -1 = not instrumented), then summarises coverage of lib/ per
+file and per directory and diffs it against a previous run.
+Usage:
+  python3 scripts/reporting/lcov_coverage.py coverage/lcov.info [more shards...] --baseline prev.json --out coverage_summary.json
+"""
+import argparse
+import gzip
+import json
+from array import array
+
+NOT_INSTRUMENTED = -1
+SOURCE_ROOT = 'lib/'
+
+
+def normalize_source(path):
+    """Project-relative source path: absolute CI paths are cut back to their lib/ segment."""
+    path = path.replace('\\', '/')
+    if path.startswith(SOURCE_ROOT):
+        return path
+    idx = path.rfind('/' + SOURCE_ROOT)
+    return path[idx + 1:] if idx != -1 else path
+
+
+class LcovMerge:
+    """Line-hit arrays per source file, merged across any number of lcov files."""
+
+    def __init__(self):
+        self.files = {}
+
+    def _hits(self, source, max_line):
+        hits = self.files.get(source)
+        if hits is None:
+            hits = self.files[source] = array('q')
+        missing = max_line + 1 - len(hits)
+        if missing > 0:
+            hits.extend(array('q', [NOT_INSTRUMENTED]) * missing)
+        return hits
+
+    def add_file(self, path):
+        opener = gzip.open if path.endswith('.gz') else open
+        hits = None
+        with opener(path, 'rb') as f:
+            for line in f:
+                if line.startswith(b'DA:'):
+                    # DA:<line>,<hits>[,<checksum>]
+                    fields = line[3:].split(b',', 2)
+                    lineno, count = int(fields[0]), int(fields[1])
+                    if len(hits) <= lineno:
+                        hits = self._hits(source, max(lineno, 2 * len(hits)))
+                    prev = hits[lineno]
+                    hits[lineno] = count if prev < 0 else prev + count
+                elif line.startswith(b'SF:'):
+                    source = normalize_source(line[3:].strip().decode('utf-8', errors='replace'))
+                    hits = self._hits(source, 0)
+                elif line.startswith(b'end_of_record'):
+                    hits = None
+        return self
+
+    def file_stats(self, root=SOURCE_ROOT):
+        """{source: (lines_found, lines_hit)} for sources under `root`."""
+        stats = {}
+        for source, hits in self.files.items():
+            if root and not source.startswith(root):
+                continue
+            found = len(hits) - hits.count(NOT_INSTRUMENTED)
+            hit = found - hits.count(0)
+            if found:
+                stats[source] = (found, hit)
+        return stats
+
+
+def directory_stats(file_stats):
+    """Roll file totals up into every ancestor directory ("lib", "lib/src", ...)."""
+    dirs = {}
+    for source, (found, hit) in file_stats.items():
+        parts = source.split('/')[:-1]
+        for depth in range(1, len(parts) + 1):
+            d = '/'.join(parts[:depth])
+            f, h = dirs.get(d, (0, 0))
+            dirs[d] = (f + found, h + hit)
+    return dirs
+
+
+def pct(found, hit):
+    return 100.0 * hit / found if found else 0.0
+
+
+def summarize(paths, root=SOURCE_ROOT):
+    merged = LcovMerge()
+    for path in paths:
+        merged.add_file(path)
+    files = merged.file_stats(root)
+    found = sum(f for f, _ in files.values())
+    hit = sum(h for _, h in files.values())
+    return {
+        'coverage': {
+            'sources': list(paths),
+            'lines_found': found,
+            'lines_hit': hit,
+            'percent': round(pct(found, hit), 2),
+            'files': {s: {'found': f, 'hit': h} for s, (f, h) in sorted(files.items())},
+            'directories': {d: {'found': f, 'hit': h} for d, (f, h) in sorted(directory_stats(files).items())},
+        }
+    }
+
+
+def load_summary(path):
+    """A previous run as a summary: either summarize() JSON or a raw lcov file."""
+    if path.endswith('.json'):
+        with open(path) as f:
+            return json.load(f)
+    return summarize([path])
+
+
+def diff(current, baseline):
+    """Per-file coverage change in percentage points, including added and removed files."""
+    cur, base = current['coverage']['files'], baseline['coverage']['files']
+    changes = {}
+    for source in set(cur) | set(base):
+        c, b = cur.get(source), base.get(source)
+        c_pct = pct(c['found'], c['hit']) if c else None
+        b_pct = pct(b['found'], b['hit']) if b else None
+        if c_pct != b_pct:
+            changes[source] = (b_pct, c_pct)
+    return changes
+
+
+def coverage_section(summary, baseline=None, top=15):
+    """Markdown report section for a coverage summary."""
+    cov = summary['coverage']
+    md = "\n### 🧪 Code Coverage (lib/)\n\n"
+    line = f"**{cov['percent']:.2f}%** of {cov['lines_found']} instrumented lines hit"
+    if baseline:
+        delta = cov['percent'] - baseline['coverage']['percent']
+        line += f" ({delta:+.2f} pp vs previous run at {baseline['coverage']['percent']:.2f}%)"
+    md += line + ".\n\n"
+
+    dirs = cov['directories']
+    if dirs:
+        md += "| Directory | Lines | Hit | Coverage |\n| :--- | ---: | ---: | ---: |\n"
+        for d, s in dirs.items():
+            if d.count('/') <= 1:
+                md += f"| {d}/ | {s['found']} | {s['hit']} | {pct(s['found'], s['hit']):.1f}% |\n"
+
+    files = sorted(cov['files'].items(), key=lambda kv: (pct(kv[1]['found'], kv[1]['hit']), -kv[1]['found']))
+    if files:
+        md += f"\n**Least covered files** (bottom {min(top, len(files))}):\n\n"
+        md += "| File | Lines | Hit | Coverage |\n| :--- | ---: | ---: | ---: |\n"
+        for source, s in files[:top]:
+            md += f"| {source} | {s['found']} | {s['hit']} | {pct(s['found'], s['hit']):.1f}% |\n"
+
+    if baseline:
+        changes = diff(summary, baseline)
+        if changes:
+            md += f"\n**Coverage changes vs previous run** ({len(changes)} file(s)):\n\n"
+            md += "| File | Before | After | Change |\n| :--- | ---: | ---: | ---: |\n"
+            ranked = sorted(changes.items(), key=lambda kv: -abs((kv[1][1] or 0) - (kv[1][0] or 0)))
+            for source, (before, after) in ranked[:top]:
+                b = f"{before:.1f}%" if before is not None else 'new'
+                a = f"{after:.1f}%" if after is not None else 'removed'
+                change = f"{(after or 0) - (before or 0):+.1f} pp" if before is not None and after is not None else '-'
+                md += f"| {source} | {b} | {a} | {change} |\n"
+    return md
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument('lcov', nargs='+', help='lcov.info files (shards are merged)')
+    p.add_argument('--baseline', '-b', help='Previous run: coverage summary JSON or lcov file')
+    p.add_argument('--out', '-o', default='coverage_summary.json')
+    args = p.parse_args()
+
+    summary = summarize(args.lcov)
+    with open(args.out, 'w') as f:
+        json.dump(summary, f, indent=2)
+    baseline = load_summary(args.baseline) if args.baseline else None
+    print(coverage_section(summary, baseline))
+    print('Wrote coverage summary to', args.out)
+
+
+if __name__ == '__main__':
+    main()
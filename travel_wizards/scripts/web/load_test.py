@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Async HTTP load generator for the served Travel Wizards web build.
+Each virtual user replays the app's routes (taken from tests/test_all_screens_selenium.py) plus the
+bootstrap assets a Flutter web page load pulls, at a fixed concurrency or a target request rate.
+Writes throughput, p50/p95/p99 latency and error rates in the {"results": [...]} shape read by
+scripts/reporting/generate_report.py.
+Usage:
+  python3 scripts/web/load_test.py --url=http://localhost:8080 --concurrency=20 --duration=30
+  python3 scripts/web/load_test.py --url=http://localhost:8080 --rate=200 --build-dir=build/web --out=artifacts/load_results.json
+
+The app uses hash routing, so every route visit fetches "/" from the server; pass --path-routes
+when the build is served with a path URL strategy and the server rewrites /<route> to index.html.
+"""
+import argparse
+import ast
+import asyncio
+import json
+import math
+import os
+import ssl
+import time
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+
+WORKSPACE_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+ROUTES_SOURCE = os.path.join(WORKSPACE_ROOT, 'tests', 'test_all_screens_selenium.py')
+
+# Files a Flutter web page load requests after index.html
+BOOTSTRAP_ASSETS = [
+    'flutter_bootstrap.js',
+    'flutter.js',
+    'main.dart.js',
+    'manifest.json',
+    'favicon.png',
+    'assets/AssetManifest.bin.json',
+    'assets/FontManifest.json',
+]
+
+
+def load_routes(path=ROUTES_SOURCE):
+    """Route paths passed to navigate_to_route() in the screen suite, in file order."""
+    with open(path) as f:
+        tree = ast.parse(f.read(), filename=path)
+    routes = []
+    for node in ast.walk(tree):
+        if (isinstance(node, ast.Call) and getattr(node.func, 'id', None) == 'navigate_to_route'
+                and node.args and isinstance(node.args[-1], ast.Constant)
+                and isinstance(node.args[-1].value, str)):
+            routes.append(node.args[-1].value)
+    return sorted(set(routes), key=routes.index)
+
+
+def bootstrap_assets(build_dir=None):
+    """Bootstrap assets, limited to those present in the build output when it is given."""
+    if not build_dir:
+        return list(BOOTSTRAP_ASSETS)
+    return [a for a in BOOTSTRAP_ASSETS if os.path.isfile(os.path.join(build_dir, a))]
+
+
+def visit_plan(routes, assets, base_path, path_routes):
+    """Request paths for one pass over every route, each followed by the page's bootstrap assets."""
+    plan = []
+    for route in routes:
+        plan.append(base_path + (route if path_routes else ''))
+        plan.extend(base_path + a for a in assets)
+    return plan
+
+
+class Connection:
+    """Minimal keep-alive HTTP/1.1 GET client on asyncio streams."""
+
+    def __init__(self, host, port, use_ssl):
+        self.host, self.port = host, port
+        self.ssl = ssl.create_default_context() if use_ssl else None
+        self.reader = self.writer = None
+
+    async def _send(self, path):
+        """Send the request and return the status line (b'' if the server closed the connection)."""
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+        self.writer.write(
+            f"GET {path} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n"
+            f"Accept-Encoding: gzip, br\r\nConnection: keep-alive\r\n\r\n".encode())
+        await self.writer.drain()
+        return await self.reader.readline()
+
+    async def get(self, path):
+        reused = self.writer is not None
+        try:
+            status_line = await self._send(path)
+        except (ConnectionResetError, BrokenPipeError):
+            if not reused:
+                raise
+            status_line = b''
+        if not status_line and reused:
+            # The server closed the idle keep-alive connection before answering; reconnect and resend once
+            self.close()
+            status_line = await self._send(path)
+        if not status_line:
+            raise ConnectionError('connection closed by server')
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        nbytes = 0
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            while True:
+                size = int((await self.reader.readline()).split(b';')[0], 16)
+                await self.reader.readexactly(size + 2)
+                nbytes += size
+                if size == 0:
+                    break
+        elif 'content-length' in headers:
+            nbytes = int(headers['content-length'])
+            await self.reader.readexactly(nbytes)
+        else:
+            nbytes = len(await self.reader.read())
+            self.close()
+        connection = headers.get('connection', '').lower()
+        if connection == 'close' or (status_line.startswith(b'HTTP/1.0') and connection != 'keep-alive'):
+            self.close()
+        return status, nbytes
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+class Stats:
+    def __init__(self):
+        self.latencies = {}
+        self.errors = {}
+        self.bytes = 0
+
+    def record(self, path, latency, ok, nbytes=0):
+        self.latencies.setdefault(path, [])
+        self.errors.setdefault(path, 0)
+        if ok:
+            self.latencies[path].append(latency)
+            self.bytes += nbytes
+        else:
+            self.errors[path] += 1
+
+
+async def fetch(pool, path, stats, timeout, started):
+    """One request on a pooled connection; latency counts from `started` so queueing is included."""
+    conn = await pool.get()
+    try:
+        status, nbytes = await asyncio.wait_for(conn.get(path), timeout)
+        stats.record(path, time.perf_counter() - started, status < 400, nbytes)
+    except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError, IndexError):
+        conn.close()
+        stats.record(path, time.perf_counter() - started, False)
+    finally:
+        pool.put_nowait(conn)
+
+
+async def closed_loop(pool, plan, stats, deadline, timeout, offset):
+    i = offset
+    while time.perf_counter() < deadline:
+        await fetch(pool, plan[i % len(plan)], stats, timeout, time.perf_counter())
+        i += 1
+
+
+async def open_loop(pool, plan, stats, deadline, timeout, rate):
+    """Issue requests on a fixed schedule regardless of response times (no coordinated omission)."""
+    tasks = set()
+    interval = 1.0 / rate
+    start = time.perf_counter()
+    i = 0
+    while True:
+        due = start + i * interval
+        if due >= deadline:
+            break
+        delay = due - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        task = asyncio.create_task(fetch(pool, plan[i % len(plan)], stats, timeout, due))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        i += 1
+    if tasks:
+        await asyncio.gather(*tasks)
+
+
+async def run_load(url, plan, concurrency, duration, rate=None, timeout=10.0):
+    parts = urlsplit(url)
+    use_ssl = parts.scheme == 'https'
+    port = parts.port or (443 if use_ssl else 80)
+    pool = asyncio.Queue()
+    for _ in range(concurrency):
+        pool.put_nowait(Connection(parts.hostname, port, use_ssl))
+
+    stats = Stats()
+    start = time.perf_counter()
+    deadline = start + duration
+    if rate:
+        await open_loop(pool, plan, stats, deadline, timeout, rate)
+    else:
+        # Stagger users across the plan so they do not all hit the same file at once
+        step = max(1, len(plan) // concurrency)
+        await asyncio.gather(*(closed_loop(pool, plan, stats, deadline, timeout, u * step)
+                               for u in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    while not pool.empty():
+        pool.get_nowait().close()
+    return stats, elapsed
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    # Nearest-rank percentile
+    k = max(0, math.ceil(p / 100 * len(sorted_values)) - 1)
+    return sorted_values[k]
+
+
+def summarize(name, latencies, errors, elapsed):
+    lat = sorted(latencies)
+    total = len(lat) + errors
+    return {
+        'requests': total,
+        'errors': errors,
+        'error_rate': errors / total if total else 0.0,
+        'throughput_rps': total / elapsed if elapsed else 0.0,
+        'p50_ms': percentile(lat, 50) * 1000,
+        'p95_ms': percentile(lat, 95) * 1000,
+        'p99_ms': percentile(lat, 99) * 1000,
+        'name': name,
+    }
+
+
+def status_for(summary, max_error_rate, p95_budget_ms):
+    if summary['requests'] == 0 or summary['error_rate'] > max_error_rate:
+        return 'FAIL'
+    if p95_budget_ms and summary['p95_ms'] > p95_budget_ms:
+        return 'WARN'
+    return 'PASS'
+
+
+def build_results(stats, elapsed, max_error_rate, p95_budget_ms):
+    all_latencies = [v for values in stats.latencies.values() for v in values]
+    overall = summarize('all', all_latencies, sum(stats.errors.values()), elapsed)
+    rows = [("Load_Overall", overall)]
+    rows += [(f"Load_{path}", summarize(path, stats.latencies[path], stats.errors[path], elapsed))
+             for path in sorted(stats.latencies)]
+
+    now = datetime.now(timezone.utc).isoformat()
+    results = []
+    for test, s in rows:
+        results.append({
+            'test': test,
+            'status': status_for(s, max_error_rate, p95_budget_ms),
+            'output': (f"{s['requests']} req, {s['throughput_rps']:.1f} req/s, "
+                       f"p50 {s['p50_ms']:.1f}ms / p95 {s['p95_ms']:.1f}ms / p99 {s['p99_ms']:.1f}ms, "
+                       f"errors {100 * s['error_rate']:.2f}%"),
+            'metrics': {k: round(v, 3) if isinstance(v, float) else v for k, v in s.items() if k != 'name'},
+            'timestamp': now,
+        })
+    return results, overall
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument('--url', default=os.environ.get('CHROME_APP_URL', 'http://localhost:8080'))
+    p.add_argument('--out', default='artifacts/load_results.json')
+    p.add_argument('--concurrency', '-c', type=int, default=10, help='Virtual users / open connections')
+    p.add_argument('--rate', '-r', type=float, default=None, help='Target requests per second (open loop)')
+    p.add_argument('--duration', '-t', type=float, default=30.0, help='Seconds to generate load')
+    p.add_argument('--timeout', type=float, default=10.0, help='Per-request timeout in seconds')
+    p.add_argument('--routes-from', default=ROUTES_SOURCE, help='Selenium suite to read routes from')
+    p.add_argument('--routes', help='Comma-separated routes (overrides --routes-from)')
+    p.add_argument('--build-dir', help='Flutter web build output; limits assets to files that exist')
+    p.add_argument('--path-routes', action='store_true', help='Request /<route> instead of / for each route')
+    p.add_argument('--max-error-rate', type=float, default=0.01)
+    p.add_argument('--p95-budget-ms', type=float, default=None)
+    args = p.parse_args()
+
+    routes = args.routes.split(',') if args.routes is not None else load_routes(args.routes_from)
+    base_path = urlsplit(args.url).path.rstrip('/') + '/'
+    plan = visit_plan(routes or [''], bootstrap_assets(args.build_dir), base_path, args.path_routes)
+
+    mode = f"{args.rate:g} req/s" if args.rate else f"{args.concurrency} users"
+    print(f"Load testing {args.url}: {len(routes)} routes, {len(plan)} requests per pass, {mode}, {args.duration:g}s")
+    stats, elapsed = asyncio.run(run_load(args.url, plan, args.concurrency, args.duration, args.rate, args.timeout))
+    results, overall = build_results(stats, elapsed, args.max_error_rate, args.p95_budget_ms)
+
+    outdir = os.path.dirname(args.out)
+    if outdir:
+        os.makedirs(outdir, exist_ok=True)
+    with open(args.out, 'w') as f:
+        json.dump({
+            'url': args.url,
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'summary': {'total': overall['requests'], 'errors': overall['errors'], 'bytes': stats.bytes,
+                        'duration_s': round(elapsed, 3), 'mode': mode},
+            'results': results,
+        }, f, indent=2)
+    print(results[0]['output'])
+    print('Wrote load results to', args.out)
+
+
+if __name__ == '__main__':
+    main()
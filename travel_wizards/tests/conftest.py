@@ -0,0 +1,6 @@
+"""
+Shared pytest configuration for the Travel Wizards Selenium suites
+"""
+
+# Opt-in per-test phase timings: pytest tests/ --phase-profile=artifacts
+pytest_plugins = ["phase_profiler"]
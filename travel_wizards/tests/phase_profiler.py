@@ -0,0 +1,270 @@
+"""
+Travel Wizards - Per-test phase profiler for the Selenium suites
+Times WebDriver commands, explicit waits, fixed sleeps and the screen helpers inside each test
+Usage:
+  pytest tests/ --phase-profile=artifacts
+
+Writes:
+  artifacts/phase_profile.json              per-test phase breakdown (picked up by generate_report.py)
+  artifacts/phase_stacks/phase_profile.folded  collapsed stacks for all tests (flamegraph.pl / speedscope)
+  artifacts/phase_stacks/<test>.folded         collapsed stacks for a single test
+"""
+import functools
+import json
+import os
+import re
+import sys
+import time
+from collections import defaultdict
+
+import pytest
+
+
+# Screen helpers defined by the suites that get their own frame in the profile
+PROFILED_HELPERS = ("navigate_to_route", "check_page_loaded")
+
+# Friendly phase names for the WebDriver commands the suites rely on
+COMMAND_PHASES = {
+    "get": "driver.get",
+    "findElement": "find_element",
+    "findElements": "find_elements",
+    "findChildElement": "find_element",
+    "findChildElements": "find_elements",
+    "getPageSource": "page_source",
+    "getTitle": "title",
+    "getCurrentUrl": "current_url",
+    "newSession": "webdriver.start",
+    "quit": "webdriver.quit",
+}
+
+# Self time of the pytest phases themselves (fixtures, asserts, plain Python)
+RUNTEST_PHASES = {
+    "setup": "setup",
+    "call": "test_body",
+    "teardown": "teardown",
+}
+
+_active = None
+_original_execute = None
+_original_sleep = None
+_original_until = None
+_original_until_not = None
+
+
+class PhaseTimer:
+    """Stack of nested phase frames; accumulates self time per phase and per stack"""
+
+    def __init__(self, root):
+        self.phases = defaultdict(int)
+        self.calls = defaultdict(int)
+        self.stacks = defaultdict(int)
+        self._names = [root]
+        self._frames = [[time.perf_counter_ns(), 0]]
+
+    def push(self, name):
+        self._names.append(name)
+        self._frames.append([time.perf_counter_ns(), 0])
+
+    def pop(self):
+        start, child_ns = self._frames.pop()
+        elapsed = time.perf_counter_ns() - start
+        self.stacks[";".join(self._names)] += elapsed - child_ns
+        name = self._names.pop()
+        self.phases[name] += elapsed - child_ns
+        self.calls[name] += 1
+        self._frames[-1][1] += elapsed
+
+    def finish(self):
+        """Close the root frame and return the total wall time in ns"""
+        while len(self._frames) > 1:
+            self.pop()
+        start, child_ns = self._frames.pop()
+        elapsed = time.perf_counter_ns() - start
+        if elapsed > child_ns:
+            self.stacks[self._names[0]] += elapsed - child_ns
+        return elapsed
+
+
+def _timed(name, fn):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        timer = _active
+        if timer is None:
+            return fn(*args, **kwargs)
+        timer.push(name)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            timer.pop()
+
+    wrapper.__phase_profiled__ = True
+    return wrapper
+
+
+def _timed_sleep(seconds):
+    # Only fixed sleeps written in the suites count as "sleep"; Selenium's own polling sleeps
+    # (WebDriverWait, service startup) stay in the enclosing wait/driver frame.
+    timer = _active
+    caller = sys._getframe(1).f_globals.get("__name__", "")
+    if timer is None or caller == "selenium" or caller.startswith("selenium."):
+        return _original_sleep(seconds)
+    timer.push("sleep")
+    try:
+        return _original_sleep(seconds)
+    finally:
+        timer.pop()
+
+
+def _timed_execute(self, driver_command, params=None):
+    timer = _active
+    if timer is None:
+        return _original_execute(self, driver_command, params)
+    timer.push(COMMAND_PHASES.get(driver_command, f"webdriver.{driver_command}"))
+    try:
+        return _original_execute(self, driver_command, params)
+    finally:
+        timer.pop()
+
+
+def _ms(ns):
+    return round(ns / 1e6, 3)
+
+
+def _stack_filename(nodeid):
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", nodeid).strip("_") + ".folded"
+
+
+def _write_folded(path, stacks):
+    # Collapsed-stack format: "frame;frame;frame <count>", counts in microseconds
+    with open(path, "w") as f:
+        for stack, ns in sorted(stacks.items()):
+            us = ns // 1000
+            if us > 0:
+                f.write(f"{stack} {us}\n")
+
+
+class PhaseProfiler:
+    """pytest plugin object; registered only when --phase-profile is given"""
+
+    def __init__(self, outdir):
+        self.outdir = outdir
+        self.tests = []
+        self.test_stacks = []
+        self.stacks = defaultdict(int)
+
+    def pytest_configure(self, config):
+        global _original_execute, _original_sleep, _original_until, _original_until_not
+        from selenium.webdriver.remote.webdriver import WebDriver
+        from selenium.webdriver.support.wait import WebDriverWait
+
+        _original_execute = WebDriver.execute
+        WebDriver.execute = _timed_execute
+        _original_sleep = time.sleep
+        time.sleep = _timed_sleep
+        _original_until = WebDriverWait.until
+        _original_until_not = WebDriverWait.until_not
+        WebDriverWait.until = _timed("wait", _original_until)
+        WebDriverWait.until_not = _timed("wait", _original_until_not)
+
+    def pytest_unconfigure(self, config):
+        from selenium.webdriver.remote.webdriver import WebDriver
+        from selenium.webdriver.support.wait import WebDriverWait
+
+        WebDriver.execute = _original_execute
+        time.sleep = _original_sleep
+        WebDriverWait.until = _original_until
+        WebDriverWait.until_not = _original_until_not
+
+    def pytest_collection_finish(self, session):
+        modules = {item.module for item in session.items if getattr(item, "module", None)}
+        for module in modules:
+            for name in PROFILED_HELPERS:
+                fn = getattr(module, name, None)
+                if callable(fn) and not getattr(fn, "__phase_profiled__", False):
+                    setattr(module, name, _timed(name, fn))
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        global _active
+        timer = _active = PhaseTimer(item.nodeid)
+        try:
+            yield
+        finally:
+            _active = None
+            total_ns = timer.finish()
+            self._record(item.nodeid, timer, total_ns)
+
+    def _runtest_phase(self, when):
+        timer = _active
+        if timer is not None:
+            timer.push(RUNTEST_PHASES[when])
+        try:
+            yield
+        finally:
+            if timer is not None:
+                timer.pop()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self, item):
+        yield from self._runtest_phase("setup")
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        yield from self._runtest_phase("call")
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item, nextitem):
+        yield from self._runtest_phase("teardown")
+
+    def _record(self, nodeid, timer, total_ns):
+        self.tests.append({
+            "test": nodeid,
+            "total_ms": _ms(total_ns),
+            "phases": {
+                name: {"ms": _ms(ns), "calls": timer.calls[name]}
+                for name, ns in sorted(timer.phases.items(), key=lambda kv: -kv[1])
+            },
+            "stacks": _stack_filename(nodeid),
+        })
+        for stack, ns in timer.stacks.items():
+            self.stacks[stack] += ns
+        self.test_stacks.append((nodeid, timer.stacks))
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        stackdir = os.path.join(self.outdir, "phase_stacks")
+        os.makedirs(stackdir, exist_ok=True)
+        for nodeid, stacks in self.test_stacks:
+            _write_folded(os.path.join(stackdir, _stack_filename(nodeid)), stacks)
+        _write_folded(os.path.join(stackdir, "phase_profile.folded"), self.stacks)
+
+        totals = defaultdict(lambda: {"ms": 0.0, "calls": 0})
+        for test in self.tests:
+            for name, phase in test["phases"].items():
+                totals[name]["ms"] += phase["ms"]
+                totals[name]["calls"] += phase["calls"]
+        with open(os.path.join(self.outdir, "phase_profile.json"), "w") as f:
+            json.dump({
+                "phase_profile": {
+                    "tests": self.tests,
+                    "totals": {name: {"ms": round(t["ms"], 3), "calls": t["calls"]} for name, t in totals.items()},
+                }
+            }, f, indent=2)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        terminalreporter.write_line(f"phase profile written to {self.outdir}")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--phase-profile",
+        metavar="DIR",
+        default=None,
+        help="Write per-test phase timings (JSON + collapsed stacks) to DIR",
+    )
+
+
+def pytest_configure(config):
+    outdir = config.getoption("--phase-profile")
+    if outdir:
+        os.makedirs(outdir, exist_ok=True)
+        config.pluginmanager.register(PhaseProfiler(outdir), "phase_profiler_session")
@@ -0,0 +1,103 @@
+"""
+Unit tests for scripts/reporting/android_frame_stats.py on recorded dump fixtures (no device needed)
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts', 'reporting'))
+
+from android_frame_stats import analyze, parse_framestats, parse_logcat, screen_from_filename  # noqa: E402
+
+HEADER = 'Flags,IntendedVsync,Vsync,SyncStart,FrameCompleted,'
+MS = 1_000_000
+
+
+def profile(*frames):
+    """A PROFILEDATA block from (flags, duration_ms) pairs."""
+    rows = [HEADER]
+    for i, (flags, duration) in enumerate(frames):
+        start = (i + 1) * 100 * MS
+        rows.append(f"{flags},{start},{start},{start + MS},{start + int(duration * MS)},")
+    return '---PROFILEDATA---\n' + '\n'.join(rows) + '\n---PROFILEDATA---\n'
+
+
+def test_framestats_keeps_only_flags_zero_frames():
+    text = 'Window: com.example.trip_wizards/com.example.trip_wizards.MainActivity\n' + profile(
+        (0, 10), (1, 500), (0, 20), (4, 30), (0, 800))
+    frames = parse_framestats(text)
+    assert list(frames) == ['MainActivity']
+    np.testing.assert_allclose(frames['MainActivity'], [10, 20, 800])
+
+
+def test_framestats_without_needed_columns_is_empty():
+    text = '---PROFILEDATA---\nFlags,Vsync,\n0,1,\n---PROFILEDATA---\n'
+    assert parse_framestats(text, 'explore')['explore'].size == 0
+
+
+def test_framestats_screen_attribution():
+    window = 'Window: com.example.trip_wizards/com.example.trip_wizards.MainActivity\n'
+    assert list(parse_framestats(window + profile((0, 10)), 'explore')) == ['explore']
+    marked = '# screen: trip_details\n' + window + profile((0, 10))
+    assert list(parse_framestats(marked, 'explore')) == ['trip_details']
+    assert screen_from_filename('artifacts/framestats_explore_20261018_120000.txt') == 'explore'
+    assert screen_from_filename('artifacts/framestats_trip_details.txt') == 'trip_details'
+    assert screen_from_filename('artifacts/gfxinfo.txt') is None
+
+
+LOGCAT_MIXED = """\
+10-18 12:00:00.000   600   620 I ActivityManager: Start proc 1234:com.example.trip_wizards/u0a123 for top-activity
+10-18 12:00:01.000   600   620 I ActivityTaskManager: Displayed com.example.trip_wizards/.MainActivity: +850ms
+10-18 12:00:02.000  1234  1250 I flutter : screen=explore
+10-18 12:00:03.000  1234  1250 I OpenGLRenderer: Davey! duration=720ms; Flags=0
+10-18 12:00:03.500  1234  1234 I Choreographer: Skipped 12 frames!  The application may be doing too much work on its main thread.
+10-18 12:00:04.000  2222  2222 I Choreographer: Skipped 90 frames!  The application may be doing too much work on its main thread.
+10-18 12:00:04.500  2222  2240 I OpenGLRenderer: Davey! duration=1500ms; Flags=0
+10-18 12:00:05.000   600   620 I ActivityTaskManager: Displayed com.android.launcher3/.Launcher: +300ms
+10-18 12:00:06.000  1234  1234 I Choreographer: Skipped 3 frames!  The application may be doing too much work on its main thread.
+"""
+
+LOGCAT_PID_FILTERED = """\
+10-18 12:00:01.000  1234  1250 I OpenGLRenderer: Davey! duration=900ms; Flags=0
+10-18 12:00:02.000  1234  1234 I Choreographer: Skipped 45 frames!  The application may be doing too much work on its main thread.
+"""
+
+
+def test_logcat_counts_only_app_pid():
+    stats = parse_logcat(LOGCAT_MIXED.splitlines())
+    assert list(stats) == ['explore']
+    assert stats['explore']['skipped'] == 15
+    np.testing.assert_allclose(stats['explore']['davey_ms'], [720])
+
+
+def test_logcat_without_known_app_pid_keeps_all_lines():
+    stats = parse_logcat(LOGCAT_PID_FILTERED.splitlines())
+    assert stats['app']['skipped'] == 45
+    np.testing.assert_allclose(stats['app']['davey_ms'], [900])
+    assert parse_logcat(LOGCAT_PID_FILTERED.splitlines(), pids=[999]) == {}
+
+
+def test_logcat_displayed_sets_screen_for_app_package():
+    lines = [
+        '10-18 12:00:01.000   600   620 I ActivityTaskManager: Displayed com.example.trip_wizards/.MainActivity: +850ms',
+        '10-18 12:00:02.000  1234  1234 I Choreographer: Skipped 5 frames!',
+    ]
+    assert parse_logcat(lines, pids=[1234])['MainActivity']['skipped'] == 5
+
+
+def test_analyze_reports_malformed_dump_as_error(tmp_path):
+    good = tmp_path / 'framestats_explore.txt'
+    good.write_text(profile((0, 10), (0, 40)))
+    bad = tmp_path / 'framestats_broken.txt'
+    bad.write_text('---PROFILEDATA---\n' + HEADER + '\n0,x,2,3,4,\n---PROFILEDATA---\n')
+    logcat = tmp_path / 'logcat.txt'
+    logcat.write_text(LOGCAT_PID_FILTERED)
+
+    result = analyze([str(good), str(bad)], [str(logcat)])['frame_stats']
+    assert [e['file'] for e in result['errors']] == ['framestats_broken.txt']
+    explore = result['screens']['explore']
+    assert (explore['frames'], explore['jank_pct'], explore['slow_frames']) == (2, 50.0, 1)
+    assert explore['p90_ms'] == pytest.approx(37.0)
+    assert (result['screens']['app']['skipped_frames'], result['screens']['app']['frozen_frames']) == (45, 1)
@@ -0,0 +1,61 @@
+"""
+Unit tests for scripts/reporting/generate_report.py artifact loading (no browser needed)
+"""
+import gzip
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts', 'reporting'))
+
+from generate_report import ArtifactPreview, load_json_files  # noqa: E402
+
+
+def write_ndjson_gz(path, records):
+    with gzip.open(path, 'wt') as f:
+        for record in records:
+            f.write(json.dumps(record) + '\n')
+
+
+def test_ndjson_gz_result_rows(tmp_path):
+    write_ndjson_gz(tmp_path / 'web.ndjson.gz', [
+        {'test': 'Web_PageLoad', 'status': 'PASS', 'output': 'ok'},
+        {'test': 'Web_Title', 'status': 'FAIL', 'output': 'Title: x'},
+    ])
+    [(fn, data)] = load_json_files(str(tmp_path))
+    assert fn == 'web.ndjson.gz'
+    assert [(r['test'], r['status']) for r in data['results']] == [('Web_PageLoad', 'PASS'), ('Web_Title', 'FAIL')]
+
+
+def test_ndjson_gz_flutter_reporter_stream(tmp_path):
+    write_ndjson_gz(tmp_path / 'flutter_unit.ndjson.gz', [
+        {'type': 'start', 'protocolVersion': '0.1.1'},
+        {'type': 'testStart', 'test': {'id': 1, 'name': 'loading /test/a_test.dart'}},
+        {'type': 'testDone', 'testID': 1, 'result': 'success', 'hidden': True},
+        {'type': 'testStart', 'test': {'id': 2, 'name': 'foo'}},
+        {'type': 'testStart', 'test': {'id': 3, 'name': 'bar'}},
+        {'type': 'testDone', 'testID': 2, 'result': 'success', 'hidden': False},
+        {'type': 'testDone', 'testID': 3, 'result': 'failure', 'hidden': False},
+        {'type': 'done', 'success': False},
+    ])
+    [(_, data)] = load_json_files(str(tmp_path))
+    assert [(r['test'], r['status']) for r in data['results']] == [('foo', 'PASS'), ('bar', 'FAIL')]
+
+
+def test_plain_ndjson_reporter_stream_with_truncated_tail(tmp_path):
+    with open(tmp_path / 'flutter_unit.ndjson', 'w') as f:
+        f.write(json.dumps({'type': 'testStart', 'test': {'id': 1, 'name': 'foo'}}) + '\n')
+        f.write(json.dumps({'type': 'testDone', 'testID': 1, 'result': 'error', 'hidden': False}) + '\n')
+        f.write('{"type": "testStart", "test": {"id": 2, "na')
+    [(_, data)] = load_json_files(str(tmp_path))
+    assert [(r['test'], r['status']) for r in data['results']] == [('foo', 'FAIL')]
+
+
+def test_report_key_only_matches_object_keys(tmp_path):
+    with gzip.open(tmp_path / 'trace.json.gz', 'wt') as f:
+        json.dump({'traceEvents': [{'name': 'results', 'ts': i} for i in range(1000)]}, f)
+    with gzip.open(tmp_path / 'web.json.gz', 'wt') as f:
+        json.dump({'results' : [{'test': 'Gz', 'status': 'PASS', 'output': ''}]}, f)
+    loaded = dict(load_json_files(str(tmp_path)))
+    assert isinstance(loaded['trace.json.gz'], ArtifactPreview)
+    assert loaded['web.json.gz']['results'][0]['test'] == 'Gz'
@@ -0,0 +1,86 @@
+"""
+Unit tests for scripts/reporting/lcov_coverage.py shard merging and diffing
+"""
+import gzip
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts', 'reporting'))
+
+from lcov_coverage import NOT_INSTRUMENTED, LcovMerge, diff, normalize_source, summarize  # noqa: E402
+
+SHARD_A = """\
+SF:/home/runner/work/Trip-Wizards/travel_wizards/lib/src/app.dart
+DA:1,1
+DA:3,0
+DA:50,2
+LF:3
+LH:2
+end_of_record
+SF:/home/runner/work/Trip-Wizards/travel_wizards/test/helpers.dart
+DA:1,1
+end_of_record
+"""
+
+SHARD_B = """\
+SF:lib/src/app.dart
+DA:3,4
+DA:5,0
+end_of_record
+SF:lib/main.dart
+DA:2,0
+DA:4,1,a1b2c3
+end_of_record
+"""
+
+
+def write(path, text):
+    path.write_text(text)
+    return str(path)
+
+
+def test_normalize_source():
+    assert normalize_source('/home/runner/work/x/travel_wizards/lib/src/app.dart') == 'lib/src/app.dart'
+    assert normalize_source('C:\\work\\travel_wizards\\lib\\main.dart') == 'lib/main.dart'
+    assert normalize_source('lib/main.dart') == 'lib/main.dart'
+    assert normalize_source('test/helpers.dart') == 'test/helpers.dart'
+
+
+def test_merge_overlapping_shards(tmp_path):
+    merged = LcovMerge()
+    merged.add_file(write(tmp_path / 'a.info', SHARD_A))
+    with gzip.open(tmp_path / 'b.info.gz', 'wt') as f:
+        f.write(SHARD_B)
+    merged.add_file(str(tmp_path / 'b.info.gz'))
+
+    hits = merged.files['lib/src/app.dart']
+    assert len(hits) > 50
+    assert hits[1] == 1
+    assert hits[2] == NOT_INSTRUMENTED
+    assert hits[3] == 4
+    assert hits[5] == 0
+    assert hits[50] == 2
+    assert hits[51:].count(NOT_INSTRUMENTED) == len(hits) - 51
+
+    assert merged.file_stats() == {'lib/src/app.dart': (4, 3), 'lib/main.dart': (2, 1)}
+    # Sources outside lib/ are merged but left out of the lib/ stats
+    assert len(merged.files) == 3
+
+
+def test_summarize_directories(tmp_path):
+    summary = summarize([write(tmp_path / 'a.info', SHARD_A), write(tmp_path / 'b.info', SHARD_B)])['coverage']
+    assert (summary['lines_found'], summary['lines_hit'], summary['percent']) == (6, 4, 66.67)
+    assert summary['directories'] == {'lib': {'found': 6, 'hit': 4}, 'lib/src': {'found': 4, 'hit': 3}}
+
+
+def test_diff_added_removed_and_changed():
+    def cov(files):
+        return {'coverage': {'files': {s: {'found': f, 'hit': h} for s, (f, h) in files.items()}}}
+
+    baseline = cov({'lib/a.dart': (10, 5), 'lib/old.dart': (4, 4), 'lib/same.dart': (2, 1)})
+    current = cov({'lib/a.dart': (10, 8), 'lib/new.dart': (5, 0), 'lib/same.dart': (2, 1)})
+    assert diff(current, baseline) == {
+        'lib/a.dart': (50.0, 80.0),
+        'lib/old.dart': (100.0, None),
+        'lib/new.dart': (None, 0.0),
+    }